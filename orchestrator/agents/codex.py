@@ -5,7 +5,9 @@ Codex is used for the IMPLEMENT stage - it makes code changes.
 """
 
 import json
+import os
 import re
+import signal
 import subprocess
 import time
 from dataclasses import dataclass, field
@@ -15,6 +17,64 @@ from typing import Optional
 from orchestrator.lib.agents_config import AgentsConfig, get_stage_command
 
 
+# Seconds to wait after SIGTERM before escalating to SIGKILL on timeout
+KILL_GRACE_SECONDS = 5
+
+
+def _run_in_process_group(
+    cmd: list[str], stdin_input: Optional[str], timeout: int, cwd: Path
+) -> subprocess.CompletedProcess:
+    """Run cmd in its own process group, killing the whole group on timeout.
+
+    subprocess.run only kills the direct child on timeout. Codex spawns tools
+    (shells, test runners) that inherit its output pipes, so a surviving
+    grandchild would keep the pipes open and block the final read forever.
+    Starting a new session lets us signal every process Codex started.
+
+    Any exception while waiting (timeout, KeyboardInterrupt, undecodable
+    output) terminates the group before propagating.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if stdin_input is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=str(cwd),  # Ensure subprocess runs from worktree directory
+        start_new_session=True,
+    )
+    try:
+        stdout, stderr = proc.communicate(input=stdin_input, timeout=timeout)
+    except BaseException:
+        _kill_process_group(proc)
+        raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """SIGTERM the process group, then SIGKILL whatever is left after a grace period.
+
+    Uses wait() rather than communicate(): a second communicate() re-raises
+    the decode error that may have brought us here.
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    try:
+        proc.wait(timeout=KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        pass
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.wait()
+    for pipe in (proc.stdin, proc.stdout, proc.stderr):
+        if pipe:
+            pipe.close()
+
+
 @dataclass
 class CodexResult:
     success: bool
@@ -77,14 +137,7 @@ class CodexAgent:
 
         start_time = time.time()
         try:
-            result = subprocess.run(
-                cmd,
-                input=stdin_input,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                cwd=str(worktree)  # Ensure subprocess runs from worktree directory
-            )
+            result = _run_in_process_group(cmd, stdin_input, self.timeout, worktree)
         except subprocess.TimeoutExpired:
             elapsed = time.time() - start_time
             return CodexResult(
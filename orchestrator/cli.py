@@ -589,7 +589,7 @@ def main():
     p_open = subparsers.add_parser('open', help='Resurrect archived workstream')
     p_open.add_argument('id', help='Workstream ID')
     p_open.add_argument('--use', action='store_true', help='Set as current workstream after opening')
-    p_open.add_argument('--force', action='store_true', help='Skip confirmation for high-severity conflicts')
+    p_open.add_argument('--force', action='store_true', help='Skip staleness analysis and confirmation')
     p_open.set_defaults(func=cmd_open)
 
     # wf approve
@@ -2,11 +2,11 @@
 wf close - Close story or workstream (abandon path).
 """
 
-import shutil
 import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from orchestrator.lib.fsutil import move_dir
 from orchestrator.lib.config import (
     ProjectConfig,
     load_workstream,
@@ -39,6 +39,13 @@ def cmd_close(args, ops_dir: Path, project_config: ProjectConfig) -> int:
 
     ws = load_workstream(workstream_dir)
 
+    # Refuse to overwrite an earlier workstream archived under the same ID
+    archived_dir = workstreams_dir / "_closed" / ws_id
+    if archived_dir.exists():
+        print(f"ERROR: {archived_dir} already exists (an earlier workstream with this ID)")
+        print("  Move or remove it before closing this workstream")
+        return EXIT_INVALID_STATE
+
     # Check for uncommitted changes
     if ws.worktree.exists():
         result = subprocess.run(
@@ -92,7 +99,7 @@ def cmd_close(args, ops_dir: Path, project_config: ProjectConfig) -> int:
     dest = closed_dir / ws_id
 
     print(f"Archiving workstream to {dest}...")
-    shutil.move(str(workstream_dir), str(dest))
+    move_dir(workstream_dir, dest)
 
     # Clear context if this was the current workstream
     if get_current_workstream(ops_dir) == ws_id:
@@ -177,6 +184,13 @@ def cmd_close_no_changes(args, ops_dir: Path, project_config: ProjectConfig) ->
     ws = load_workstream(workstream_dir)
     project_dir = ops_dir / "projects" / project_config.name
 
+    # Refuse to overwrite an earlier workstream archived under the same ID
+    archived_dir = workstreams_dir / "_closed" / ws_id
+    if archived_dir.exists():
+        print(f"ERROR: {archived_dir} already exists (an earlier workstream with this ID)")
+        print("  Move or remove it before closing this workstream")
+        return EXIT_INVALID_STATE
+
     # Find linked story
     story = find_story_by_workstream(project_dir, ws_id)
     if not story:
@@ -256,7 +270,7 @@ def cmd_close_no_changes(args, ops_dir: Path, project_config: ProjectConfig) ->
     closed_dir = workstreams_dir / "_closed"
     closed_dir.mkdir(exist_ok=True)
     dest = closed_dir / ws_id
-    shutil.move(str(workstream_dir), str(dest))
+    move_dir(workstream_dir, dest)
 
     # 8. Clear context if this was the current workstream
     if get_current_workstream(ops_dir) == ws_id:
@@ -11,7 +11,10 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
-from orchestrator.lib.constants import MAX_WS_ID_LEN, WS_ID_PATTERN
+from orchestrator.git import resolve_revs
+from orchestrator.lib.constants import (
+    MAX_WS_ID_LEN, WS_ID_PATTERN, META_ENV_TEMPLATE, WORKSTREAM_SUBDIRS,
+)
 from orchestrator.pm.stories import load_story, update_story
 
 
@@ -88,24 +91,19 @@ def cmd_new(args, ops_dir: Path, project_config) -> int:
         print(f"ERROR: Worktree path already exists: {worktree_path}")
         return 2
 
-    # Check branch doesn't exist
-    result = subprocess.run(
-        ["git", "-C", str(repo_path), "show-ref", "--verify", f"refs/heads/{branch_name}"],
-        capture_output=True
-    )
-    if result.returncode == 0:
+    # Check branch doesn't exist and get BASE_SHA from default branch
+    # (one git process for both lookups)
+    branch_ref = f"refs/heads/{branch_name}"
+    base_rev = f"{default_branch}^{{commit}}"
+    shas = resolve_revs(repo_path, [branch_ref, base_rev])
+    if shas[branch_ref]:
         print(f"ERROR: Branch '{branch_name}' already exists")
         return 2
 
-    # Get BASE_SHA from default branch
-    result = subprocess.run(
-        ["git", "-C", str(repo_path), "rev-parse", default_branch],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
+    base_sha = shas[base_rev]
+    if not base_sha:
         print(f"ERROR: Could not find branch '{default_branch}'")
         return 2
-    base_sha = result.stdout.strip()
 
     # Create branch + worktree
     print(f"Creating worktree at {worktree_path}...")
@@ -120,23 +118,15 @@ def cmd_new(args, ops_dir: Path, project_config) -> int:
     # Create workstream directory structure
     print(f"Creating workstream directory at {workstream_dir}...")
     workstream_dir.mkdir(parents=True)
-    (workstream_dir / "clarifications" / "pending").mkdir(parents=True)
-    (workstream_dir / "clarifications" / "answered").mkdir(parents=True)
-    (workstream_dir / "uat" / "pending").mkdir(parents=True)
-    (workstream_dir / "uat" / "passed").mkdir(parents=True)
+    for subdir in WORKSTREAM_SUBDIRS:
+        (workstream_dir / subdir).mkdir()
 
     # Write meta.env
     now = datetime.now().isoformat()
-    meta_content = f'''ID="{ws_id}"
-TITLE="{title}"
-BRANCH="{branch_name}"
-WORKTREE="{worktree_path}"
-BASE_BRANCH="{default_branch}"
-BASE_SHA="{base_sha}"
-STATUS="active"
-CREATED_AT="{now}"
-LAST_REFRESHED="{now}"
-'''
+    meta_content = META_ENV_TEMPLATE.format(
+        ws_id=ws_id, title=title, branch=branch_name, worktree=worktree_path,
+        base_branch=default_branch, base_sha=base_sha, now=now,
+    )
     (workstream_dir / "meta.env").write_text(meta_content)
 
     # Write plan.md template
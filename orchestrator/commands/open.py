@@ -4,17 +4,52 @@ wf open - Resurrect an archived workstream.
 
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from orchestrator.git import resolve_revs
 from orchestrator.lib.config import (
     ProjectConfig,
     load_workstream,
     set_current_workstream,
+    update_workstream_meta,
 )
 from orchestrator.workflow.state_machine import transition, WorkstreamState
+from orchestrator.lib.fsutil import move_dir
 from orchestrator.lib.constants import EXIT_SUCCESS, EXIT_ERROR, EXIT_NOT_FOUND, EXIT_INVALID_STATE
 
 
+def _git(repo_path: Path, *args: str) -> subprocess.CompletedProcess:
+    """Run a git command in repo_path, capturing text output."""
+    return subprocess.run(["git", "-C", str(repo_path), *args], capture_output=True, text=True)
+
+
+def _parse_numstat(output: str) -> dict[str, tuple[int, int]]:
+    """
+    Parse `git diff --numstat -z` output into {path: (added, deleted)}.
+
+    Binary files ('-' counts) are reported as 0/0. Renames are keyed by
+    their new path.
+    """
+    stats = {}
+    # Format: "<added>\t<deleted>\t<path>\0", or for renames
+    # "<added>\t<deleted>\t\0<old>\0<new>\0"
+    fields = iter(output.split('\0'))
+    for entry in fields:
+        parts = entry.split('\t', 2)
+        if len(parts) != 3:
+            continue
+        added, deleted, path = parts
+        if not path:
+            next(fields, None)
+            path = next(fields, "")
+        stats[path] = (
+            int(added) if added != '-' else 0,
+            int(deleted) if deleted != '-' else 0,
+        )
+    return stats
+
+
 def analyze_staleness(repo_path: Path, branch: str, base_sha: str, default_branch: str):
     """
     Analyze how stale the branch is compared to main.
@@ -22,44 +57,28 @@ def analyze_staleness(repo_path: Path, branch: str, base_sha: str, default_branc
     Returns: (commits_behind, overlap_files, main_lines_changed, file_details)
     """
     # 1. Commits behind main
-    result = subprocess.run(
-        ["git", "-C", str(repo_path), "rev-list", "--count", f"{branch}..{default_branch}"],
-        capture_output=True, text=True
-    )
+    result = _git(repo_path, "rev-list", "--count", f"{branch}..{default_branch}")
     commits_behind = int(result.stdout.strip()) if result.returncode == 0 else 0
+    if commits_behind == 0:
+        # Main is already in the branch; nothing on main can conflict
+        return 0, set(), 0, {}
 
-    # 2. Files this branch touched
-    result = subprocess.run(
-        ["git", "-C", str(repo_path), "diff", "--name-only", f"{base_sha}..{branch}"],
-        capture_output=True, text=True
-    )
-    branch_files = set(f for f in result.stdout.strip().split('\n') if f)
+    # The two diffs are independent; run them concurrently
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # 2. Files this branch touched
+        branch_future = executor.submit(_git, repo_path, "diff", "--name-only", "-z", f"{base_sha}..{branch}")
+        # 3. Files main touched since base, with line counts, in one call
+        result = _git(repo_path, "diff", "--numstat", "-z", f"{base_sha}..{default_branch}")
 
-    # 3. Files main touched since base
-    result = subprocess.run(
-        ["git", "-C", str(repo_path), "diff", "--name-only", f"{base_sha}..{default_branch}"],
-        capture_output=True, text=True
-    )
-    main_files = set(f for f in result.stdout.strip().split('\n') if f)
+    branch_files = set(f for f in branch_future.result().stdout.split('\0') if f)
+    main_numstat = _parse_numstat(result.stdout)
 
     # 4. Overlap = potential conflicts
-    overlap = branch_files & main_files
-
-    # 5. Get line counts for overlapping files (changes on main)
-    main_lines_changed = 0
-    file_details = {}
-    for filepath in overlap:
-        result = subprocess.run(
-            ["git", "-C", str(repo_path), "diff", "--numstat", f"{base_sha}..{default_branch}", "--", filepath],
-            capture_output=True, text=True
-        )
-        if result.stdout.strip():
-            parts = result.stdout.strip().split('\t')
-            if len(parts) >= 2:
-                added = int(parts[0]) if parts[0] != '-' else 0
-                deleted = int(parts[1]) if parts[1] != '-' else 0
-                file_details[filepath] = (added, deleted)
-                main_lines_changed += added + deleted
+    overlap = branch_files & main_numstat.keys()
+
+    # 5. Line counts for overlapping files (changes on main)
+    file_details = {f: main_numstat[f] for f in overlap}
+    main_lines_changed = sum(added + deleted for added, deleted in file_details.values())
 
     return commits_behind, overlap, main_lines_changed, file_details
 
@@ -142,39 +161,37 @@ def cmd_open(args, ops_dir: Path, project_config: ProjectConfig) -> int:
     ws = load_workstream(closed_dir)
 
     # 4. Verify git branch still exists
-    result = subprocess.run(
-        ["git", "-C", str(project_config.repo_path),
-         "show-ref", "--verify", f"refs/heads/{ws.branch}"],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
+    branch_rev = f"refs/heads/{ws.branch}^{{commit}}"
+    if not resolve_revs(project_config.repo_path, [branch_rev])[branch_rev]:
         print(f"ERROR: Branch '{ws.branch}' no longer exists")
         print(f"  Was it deleted with 'wf archive delete {ws_id}'?")
         return EXIT_ERROR
 
-    # 5. Analyze staleness
-    commits_behind, overlap, main_lines_changed, file_details = analyze_staleness(
-        project_config.repo_path, ws.branch, ws.base_sha, project_config.default_branch
-    )
-    severity, score, recommendation = calculate_severity(
-        commits_behind, len(overlap), main_lines_changed
-    )
-
-    print_staleness_report(
-        ws_id, commits_behind, overlap, main_lines_changed,
-        file_details, severity, score, recommendation
-    )
-
-    # 6. For high/critical severity, require confirmation
-    if severity in ("high", "critical") and not getattr(args, 'force', False):
-        try:
-            response = input("\nProceed anyway? [y/N]: ").strip().lower()
-            if response not in ('y', 'yes'):
-                print("Aborted.")
+    # 5. Analyze staleness (skipped with --force, which would not act on it)
+    severity = None
+    if not getattr(args, 'force', False):
+        commits_behind, overlap, main_lines_changed, file_details = analyze_staleness(
+            project_config.repo_path, ws.branch, ws.base_sha, project_config.default_branch
+        )
+        severity, score, recommendation = calculate_severity(
+            commits_behind, len(overlap), main_lines_changed
+        )
+
+        print_staleness_report(
+            ws_id, commits_behind, overlap, main_lines_changed,
+            file_details, severity, score, recommendation
+        )
+
+        # 6. For high/critical severity, require confirmation
+        if severity in ("high", "critical"):
+            try:
+                response = input("\nProceed anyway? [y/N]: ").strip().lower()
+                if response not in ('y', 'yes'):
+                    print("Aborted.")
+                    return EXIT_ERROR
+            except (EOFError, KeyboardInterrupt):
+                print("\nAborted.")
                 return EXIT_ERROR
-        except (EOFError, KeyboardInterrupt):
-            print("\nAborted.")
-            return EXIT_ERROR
 
     print("\nReopening...")
 
@@ -182,43 +199,24 @@ def cmd_open(args, ops_dir: Path, project_config: ProjectConfig) -> int:
     worktree_path = ops_dir / "worktrees" / ws_id
     if worktree_path.exists():
         print(f"  Worktree path exists, cleaning up...")
-        # Try to remove stale worktree reference
-        subprocess.run(
-            ["git", "-C", str(project_config.repo_path), "worktree", "prune"],
-            capture_output=True
-        )
-        if worktree_path.exists():
-            shutil.rmtree(str(worktree_path))
-
-    result = subprocess.run(
-        ["git", "-C", str(project_config.repo_path),
-         "worktree", "add", str(worktree_path), ws.branch],
-        capture_output=True, text=True
-    )
+        shutil.rmtree(str(worktree_path))
+
+    add_args = ("worktree", "add", str(worktree_path), ws.branch)
+    result = _git(project_config.repo_path, *add_args)
+    if result.returncode != 0:
+        # A stale worktree reference to this path blocks add; prune and retry
+        _git(project_config.repo_path, "worktree", "prune")
+        result = _git(project_config.repo_path, *add_args)
     if result.returncode != 0:
         print(f"ERROR: Failed to create worktree: {result.stderr}")
         return EXIT_ERROR
 
     # 8. Update meta.env - update WORKTREE path and remove CLOSED_AT
     # Note: STATUS is preserved here; FSM transition() updates it after directory move
-    meta_path = closed_dir / "meta.env"
-    content = meta_path.read_text()
-    lines = content.splitlines()
-    new_lines = []
-    for line in lines:
-        if line.startswith("STATUS="):
-            new_lines.append(line)
-        elif line.startswith("WORKTREE="):
-            new_lines.append(f'WORKTREE="{worktree_path}"')
-        elif line.startswith("CLOSED_AT="):
-            # Remove CLOSED_AT when reopening
-            continue
-        else:
-            new_lines.append(line)
-    meta_path.write_text("\n".join(new_lines) + "\n")
+    update_workstream_meta(closed_dir, {"WORKTREE": str(worktree_path), "CLOSED_AT": None})
 
     # 9. Move directory back to active
-    shutil.move(str(closed_dir), str(active_dir))
+    move_dir(closed_dir, active_dir)
 
     # 10. Transition to active via FSM (validates transition from closed -> active)
     transition(active_dir, WorkstreamState.ACTIVE, reason="reopening workstream")
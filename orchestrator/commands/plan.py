@@ -18,6 +18,7 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+from orchestrator.git import commit_file
 from orchestrator.lib.config import ProjectConfig, load_workstream
 from orchestrator.lib.agents_config import load_agents_config, get_stage_command
 from orchestrator.lib.planparse import parse_plan
@@ -45,6 +46,25 @@ from orchestrator.pm.planner import run_plan_session, run_refine_session, run_ed
 from orchestrator.pm.reqs_annotate import annotate_reqs_for_story
 from orchestrator.runner.impl.breakdown import append_commits_to_plan
 
+# Verdict formats the AI might use in final_review.md
+APPROVE_VERDICT_PATTERN = re.compile(r'\*\*APPROVE\*\*|VERDICT: APPROVE|## APPROVE|APPROVED', re.IGNORECASE)
+CONCERNS_VERDICT_PATTERN = re.compile(r'\*\*CONCERNS\*\*|VERDICT: CONCERNS|## CONCERNS', re.IGNORECASE)
+CONCERN_WORD_PATTERN = re.compile(r'CONCERN', re.IGNORECASE)
+CONCERNS_WORD_PATTERN = re.compile(r'CONCERNS', re.IGNORECASE)
+# Section heading: ## Concerns or ### Concerns or ### 1. Concerns, etc.
+CONCERNS_SECTION_PATTERN = re.compile(
+    r'##+ (?:\d+\.\s*)?Concerns\s*\n(.*?)(?=\n##[^#]|\n\*\*[A-Z]|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+
+
+def _truncate(text: str, limit: int = 80) -> str:
+    """Cut text at the last space before limit, marking the cut with '...'."""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(' ', 0, limit)
+    return text[:cut if cut != -1 else limit] + "..."
+
 
 def extract_final_review_concerns(final_review_path: Path) -> str:
     """Extract concerns section from final_review.md.
@@ -57,29 +77,19 @@ def extract_final_review_concerns(final_review_path: Path) -> str:
         return ""
 
     # Check for APPROVE verdict - multiple formats the AI might use
-    content_upper = content.upper()
-    approve_indicators = ["**APPROVE**", "VERDICT: APPROVE", "## APPROVE", "APPROVED"]
-    if any(indicator in content_upper for indicator in approve_indicators):
+    if APPROVE_VERDICT_PATTERN.search(content):
         # Double-check it's not "APPROVED WITH CONCERNS" or similar
-        if "CONCERN" not in content_upper:
+        if not CONCERN_WORD_PATTERN.search(content):
             return ""
 
     # Check for explicit CONCERNS verdict
-    concerns_indicators = ["**CONCERNS**", "VERDICT: CONCERNS", "## CONCERNS"]
-    has_concerns_verdict = any(indicator in content_upper for indicator in concerns_indicators)
-
-    if not has_concerns_verdict:
+    if not CONCERNS_VERDICT_PATTERN.search(content):
         # Either: (1) APPROVE verdict with "concern" word in discussion text, or
         #         (2) No clear verdict at all. Either way, no actionable concerns.
         return ""
 
     # Try to extract just the concerns section
-    # Pattern: ## Concerns or ### Concerns or ### 1. Concerns, etc.
-    concerns_match = re.search(
-        r'##+ (?:\d+\.\s*)?Concerns\s*\n(.*?)(?=\n##[^#]|\n\*\*[A-Z]|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    concerns_match = CONCERNS_SECTION_PATTERN.search(content)
     if concerns_match:
         extracted = concerns_match.group(1).strip()
         if extracted:
@@ -87,10 +97,10 @@ def extract_final_review_concerns(final_review_path: Path) -> str:
 
     # Parsing failed but we know there are concerns - return everything after the verdict
     # so the AI can make sense of it
-    verdict_pos = content_upper.find("CONCERNS")
-    if verdict_pos != -1:
+    verdict_match = CONCERNS_WORD_PATTERN.search(content)
+    if verdict_match:
         # Find the next newline after "CONCERNS" and return everything after
-        newline_pos = content.find("\n", verdict_pos)
+        newline_pos = content.find("\n", verdict_match.end())
         if newline_pos != -1:
             remainder = content[newline_pos:].strip()
             if remainder:
@@ -145,7 +155,7 @@ def cmd_plan_discover(args, ops_dir: Path, project_config: ProjectConfig):
     yes_flag = getattr(args, 'yes', False)
 
     # Check for REQS.md
-    reqs_path = Path(project_config.repo_path) / "REQS.md"
+    reqs_path = project_config.repo_path / project_config.reqs_path
     if not reqs_path.exists():
         print(f"No REQS.md found at {reqs_path}")
         print("Use 'wf plan story' or 'wf plan bug' for quick stories.")
@@ -269,12 +279,14 @@ def resolve_smart_feedback(feedback: str | None) -> str | None:
     if not feedback:
         return None
 
-    # Check if it's an existing file
-    if os.path.isfile(feedback):
-        try:
-            return Path(feedback).read_text()
-        except OSError as e:
-            logger.warning(f"Could not read file '{feedback}': {e}. Using as literal text.")
+    # Try it as a file first; anything that doesn't name a file is literal text
+    try:
+        return Path(feedback).read_text()
+    except PermissionError as e:
+        logger.warning(f"Could not read file '{feedback}': {e}. Using as literal text.")
+    except (OSError, ValueError):
+        # Missing, a directory, a name too long for a path, or an embedded NUL
+        pass
 
     return feedback
 
@@ -289,45 +301,24 @@ def annotate_and_commit_reqs(
 
     Returns True if annotations were made and committed.
     """
-    success, msg = annotate_reqs_for_story(story, project_config, project_dir=project_dir)
+    success, msg, changed = annotate_reqs_for_story(story, project_config, project_dir=project_dir)
 
     if not success:
         print(f"{print_prefix}Warning: {msg}")
         return False
 
-    # Check if REQS.md actually changed (git status)
-    repo_path = project_config.repo_path
-    reqs_file = project_config.reqs_path
-    status_result = subprocess.run(
-        ["git", "-C", str(repo_path), "status", "--porcelain", reqs_file],
-        capture_output=True, text=True
-    )
-    if not status_result.stdout.strip():
-        # No changes to REQS.md
+    if not changed:
+        # Nothing annotated in REQS.md
         return False
 
-    # Print truncated response
-    if len(msg) > 80:
-        truncated = msg[:80].rsplit(' ', 1)[0]
-        print(f"{print_prefix}{truncated}...")
-    else:
-        print(f"{print_prefix}{msg}")
+    print(f"{print_prefix}{_truncate(msg)}")
 
     # Commit the annotation
-    add_result = subprocess.run(
-        ["git", "-C", str(repo_path), "add", reqs_file],
-        capture_output=True, text=True
-    )
-    if add_result.returncode != 0:
-        print(f"{print_prefix}Warning: git add failed: {add_result.stderr.strip()}")
-        return False
-
-    commit_result = subprocess.run(
-        ["git", "-C", str(repo_path), "commit", "-m",
-         f"Mark requirements as WIP for {story.id}\n\n{story.title}"],
-        capture_output=True, text=True
+    commit_result = commit_file(
+        project_config.repo_path, project_config.reqs_path,
+        f"Mark requirements as WIP for {story.id}\n\n{story.title}"
     )
-    if commit_result.returncode == 0:
+    if commit_result.success:
         print(f"{print_prefix}Committed REQS annotation")
         return True
     elif "nothing to commit" in (commit_result.stdout + commit_result.stderr):
@@ -514,13 +505,9 @@ def cmd_plan_resurrect(args, ops_dir: Path, project_config: ProjectConfig):
 
     # Re-annotate REQS
     print("Re-annotating REQS.md...")
-    success, msg = annotate_reqs_for_story(story, project_config, project_dir=project_dir)
+    success, msg, _ = annotate_reqs_for_story(story, project_config, project_dir=project_dir)
     if success:
-        if len(msg) > 80:
-            truncated = msg[:80].rsplit(' ', 1)[0]
-            print(f"  {truncated}...")
-        else:
-            print(f"  {msg}")
+        print(f"  {_truncate(msg)}")
     else:
         print(f"  Warning: {msg}")
 
@@ -652,13 +639,10 @@ def cmd_plan_add(args, ops_dir: Path, project_config: ProjectConfig):
     # Find max commit number
     max_num = 0
     for c in commits:
-        c_parts = c.id.split('-')
-        if len(c_parts) >= 3:
-            try:
-                num = int(c_parts[-1])
-                max_num = max(max_num, num)
-            except ValueError:
-                pass
+        # COMMIT-<prefix>-<num>: only the trailing component is needed
+        head, _, tail = c.id.rpartition('-')
+        if '-' in head and tail.isdecimal():
+            max_num = max(max_num, int(tail))
 
     next_num = max_num + 1
     commit_id = f"COMMIT-{ws_prefix}-{next_num:03d}"
@@ -723,16 +707,20 @@ def cmd_plan_add(args, ops_dir: Path, project_config: ProjectConfig):
 
     # Parse response
     try:
-        wrapper = json.loads(result.stdout.strip())
+        wrapper = json.loads(result.stdout)
         response_text = wrapper.get("result", result.stdout)
 
-        # extract_json_with_preamble returns (preamble, json_str)
-        _, json_str = extract_json_with_preamble(response_text)
-        if json_str:
-            commit_data = json.loads(json_str)
+        if isinstance(response_text, dict):
+            # Already structured - nothing left to extract
+            commit_data = response_text
         else:
-            # Try parsing response_text directly as JSON
-            commit_data = json.loads(response_text)
+            # extract_json_with_preamble returns (preamble, json_str)
+            _, json_str = extract_json_with_preamble(response_text)
+            if json_str:
+                commit_data = json.loads(json_str)
+            else:
+                # Try parsing response_text directly as JSON
+                commit_data = json.loads(response_text)
     except (json.JSONDecodeError, TypeError) as e:
         print(f"ERROR: Failed to parse response: {e}")
         print(f"Raw output: {result.stdout[:500]}")
@@ -13,7 +13,7 @@ from prefect.exceptions import PrefectException
 
 from orchestrator.lib.config import ProjectConfig, load_project_profile, load_workstream
 from orchestrator.lib.constants import (
-    MAX_WS_ID_LEN, WS_ID_PATTERN,
+    MAX_WS_ID_LEN, WS_ID_PATTERN, META_ENV_TEMPLATE, WORKSTREAM_SUBDIRS,
     EXIT_SUCCESS, EXIT_ERROR, EXIT_NOT_FOUND, EXIT_TOOL_MISSING,
 )
 from orchestrator.lib.agents_config import load_agents_config, validate_stage_binaries
@@ -143,22 +143,14 @@ def create_workstream_from_story(
 
     print(f"Creating workstream directory at {workstream_dir}...")
     workstream_dir.mkdir(parents=True)
-    (workstream_dir / "clarifications" / "pending").mkdir(parents=True)
-    (workstream_dir / "clarifications" / "answered").mkdir(parents=True)
-    (workstream_dir / "uat" / "pending").mkdir(parents=True)
-    (workstream_dir / "uat" / "passed").mkdir(parents=True)
+    for subdir in WORKSTREAM_SUBDIRS:
+        (workstream_dir / subdir).mkdir()
 
     now = datetime.now().isoformat()
-    meta_content = f'''ID="{ws_id}"
-TITLE="{story.title}"
-BRANCH="{branch_name}"
-WORKTREE="{worktree_path}"
-BASE_BRANCH="{default_branch}"
-BASE_SHA="{base_sha}"
-STATUS="active"
-CREATED_AT="{now}"
-LAST_REFRESHED="{now}"
-'''
+    meta_content = META_ENV_TEMPLATE.format(
+        ws_id=ws_id, title=story.title, branch=branch_name, worktree=worktree_path,
+        base_branch=default_branch, base_sha=base_sha, now=now,
+    )
     (workstream_dir / "meta.env").write_text(meta_content)
 
     plan_content = _generate_plan_from_story(story)
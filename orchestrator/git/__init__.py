@@ -30,6 +30,7 @@ from orchestrator.git.branch import (
     get_current_branch,
     branch_exists,
     get_commit_sha,
+    resolve_revs,
     commit_exists,
     get_commit_count,
     is_ancestor,
@@ -40,6 +41,7 @@ from orchestrator.git.commit import (
     stage_files,
     stage_all,
     commit,
+    commit_file,
     reset_worktree,
     checkout_file,
 )
@@ -69,6 +71,7 @@ __all__ = [
     "get_current_branch",
     "branch_exists",
     "get_commit_sha",
+    "resolve_revs",
     "commit_exists",
     "get_commit_count",
     "is_ancestor",
@@ -78,6 +81,7 @@ __all__ = [
     "stage_files",
     "stage_all",
     "commit",
+    "commit_file",
     "reset_worktree",
     "checkout_file",
     # remote
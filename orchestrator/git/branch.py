@@ -27,6 +27,28 @@ def get_commit_sha(worktree: Path, ref: str = "HEAD") -> str | None:
     return None
 
 
+def resolve_revs(repo: Path, revs: list[str]) -> dict[str, str | None]:
+    """
+    Resolve several revisions to object SHAs with a single git process.
+
+    Feeds all revisions to `git cat-file --batch-check` on stdin instead of
+    spawning one show-ref/rev-parse per lookup.
+
+    Returns:
+        Dict mapping each rev to its SHA, or None if it does not resolve
+        (all None if git fails).
+    """
+    result = run_git(
+        ["cat-file", "--batch-check=%(objectname)"], repo,
+        input="".join(f"{rev}\n" for rev in revs),
+    )
+    lines = result.stdout.splitlines() if result.success else []
+    if len(lines) != len(revs):
+        return dict.fromkeys(revs)
+    # Unresolvable revs are echoed back as "<rev> missing" / "<rev> ambiguous"
+    return {rev: None if " " in line else line for rev, line in zip(revs, lines)}
+
+
 def commit_exists(worktree: Path, sha: str) -> bool:
     """Check if a commit SHA exists."""
     result = run_git(["cat-file", "-t", sha], worktree)
@@ -20,6 +20,22 @@ def commit(worktree: Path, message: str) -> GitResult:
     return run_git(["commit", "-m", message], worktree)
 
 
+def commit_file(worktree: Path, path: str, message: str) -> GitResult:
+    """
+    Stage and commit a single file, leaving anything else in the index alone.
+
+    `git commit -- <path>` stages and commits in one process, but only works
+    for files git already tracks; a new file falls back to add + commit.
+    """
+    result = run_git(["commit", "-m", message, "--", path], worktree)
+    if not result.success and "did not match any file(s) known to git" in result.stderr:
+        add_result = stage_files(worktree, [path])
+        if not add_result.success:
+            return add_result
+        result = run_git(["commit", "-m", message, "--", path], worktree)
+    return result
+
+
 def reset_worktree(worktree: Path) -> bool:
     """
     Reset uncommitted changes in worktree.
@@ -34,6 +34,18 @@ def get_diff_names(worktree: Path, ref: str = "HEAD") -> list[str]:
 
 
 def get_conflicted_files(worktree: Path) -> list[str]:
-    """Get list of files with unresolved conflicts."""
-    result = run_git(["diff", "--name-only", "--diff-filter=U"], worktree)
-    return [f.strip() for f in result.stdout.splitlines() if f.strip()]
+    """Get list of files with unresolved conflicts.
+
+    Reads unmerged entries straight from the index with `ls-files --unmerged`
+    (plumbing, no diff machinery). Uses -z so paths are NUL-terminated and
+    never quoted. Each conflicted path appears once per stage, so results
+    are deduplicated preserving order.
+    """
+    result = run_git(["ls-files", "--unmerged", "-z"], worktree)
+    files: dict[str, None] = {}
+    # Format: "<mode> <object> <stage>\t<path>\0"
+    for entry in result.stdout.split('\0'):
+        _, sep, path = entry.partition('\t')
+        if sep and path:
+            files[path] = None
+    return list(files)
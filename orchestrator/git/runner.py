@@ -24,6 +24,7 @@ def run_git(
     args: list[str],
     cwd: Path,
     timeout: int = DEFAULT_TIMEOUT,
+    input: str | None = None,
 ) -> GitResult:
     """
     Run a git command with timeout handling.
@@ -32,6 +33,7 @@ def run_git(
         args: Git command arguments (e.g., ["status", "--porcelain"])
         cwd: Working directory for the command
         timeout: Timeout in seconds
+        input: Text to send on stdin (for --stdin / --batch commands)
 
     Returns:
         GitResult with returncode, stdout, stderr, and timed_out flag
@@ -40,6 +42,7 @@ def run_git(
     try:
         result = subprocess.run(
             cmd,
+            input=input,
             capture_output=True,
             text=True,
             timeout=timeout,
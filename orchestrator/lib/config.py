@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from . import envparse
 from . import validate
+from .fsutil import is_racy_stat
 from .github import VALID_MERGE_MODES
 
 logger = logging.getLogger(__name__)
@@ -189,6 +190,10 @@ def load_project_config(project_dir: Path) -> ProjectConfig:
     )
 
 
+# Parsed profiles keyed by file path, with the (mtime_ns, size) they were parsed at
+_profile_cache: dict[Path, tuple[tuple[int, int], ProjectProfile]] = {}
+
+
 def load_project_profile(project_dir: Path) -> ProjectProfile:
     """Load project_profile.env and return ProjectProfile.
 
@@ -197,8 +202,32 @@ def load_project_profile(project_dir: Path) -> ProjectProfile:
     2. Legacy (target-based): BUILD_RUNNER, TEST_TARGET, etc.
 
     Legacy configs are automatically converted to command format.
+
+    Results are cached until the file changes on disk, so repeated loads in
+    one process skip re-parsing and the `gh auth status` probe used for the
+    default merge mode. Callers must not mutate the returned profile.
     """
-    env = envparse.load_env(str(project_dir / "project_profile.env"))
+    profile_path = project_dir / "project_profile.env"
+    try:
+        st = profile_path.stat()
+    except OSError:
+        # Let the loader raise its usual error for a missing file
+        return _parse_project_profile(profile_path)
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _profile_cache.get(profile_path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    profile = _parse_project_profile(profile_path)
+    if not is_racy_stat(st):
+        _profile_cache[profile_path] = (key, profile)
+    return profile
+
+
+def _parse_project_profile(profile_path: Path) -> ProjectProfile:
+    """Parse project_profile.env into a ProjectProfile (uncached)."""
+    env = envparse.load_env(str(profile_path))
 
     # Validate merge mode - default based on environment
     from orchestrator.lib.github import get_default_merge_mode, VALID_MERGE_MODES
@@ -331,13 +360,8 @@ def update_workstream_meta(workstream_dir: Path, updates: dict[str, str | None])
     # Update existing fields
     new_lines = []
     for line in lines:
-        field_name = None
-        for key in updates:
-            if line.startswith(f"{key}="):
-                field_name = key
-                break
-
-        if field_name:
+        field_name, sep, _ = line.partition("=")
+        if sep and field_name in updates:
             value = updates[field_name]
             applied.add(field_name)
             if value is not None:
@@ -6,6 +6,29 @@ import re
 WS_ID_PATTERN = re.compile(r'^[a-z][a-z0-9_]*$')
 MAX_WS_ID_LEN = 16
 
+# Workstream directory layout (wf new and wf run --story)
+# Subdirectories are created in order, parents first, so each is a single mkdir
+WORKSTREAM_SUBDIRS = (
+    "clarifications",
+    "clarifications/pending",
+    "clarifications/answered",
+    "uat",
+    "uat/pending",
+    "uat/passed",
+)
+
+# meta.env for a newly created workstream
+META_ENV_TEMPLATE = '''ID="{ws_id}"
+TITLE="{title}"
+BRANCH="{branch}"
+WORKTREE="{worktree}"
+BASE_BRANCH="{base_branch}"
+BASE_SHA="{base_sha}"
+STATUS="active"
+CREATED_AT="{now}"
+LAST_REFRESHED="{now}"
+'''
+
 # Human gate action constants (used by approve/reject/reset commands and stages)
 ACTION_APPROVE = "approve"
 ACTION_REJECT = "reject"
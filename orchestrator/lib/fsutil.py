@@ -0,0 +1,76 @@
+"""
+Filesystem helpers for moving workstream directories and caching parsed files.
+
+Workstream directories and their _closed/ archive nearly always live on the
+same filesystem, where a move is a single rename. shutil.move is only used
+for the cross-device case, where it falls back to copy + delete.
+"""
+
+import errno
+import os
+import shutil
+import time
+from pathlib import Path
+
+# A file modified this recently could be rewritten again within the same
+# mtime tick at the same size, so (mtime_ns, size) does not yet identify it
+RACY_MTIME_NS = 2_000_000_000
+
+
+def is_racy_stat(st: os.stat_result) -> bool:
+    """Return True if a file is too recently modified to cache by (mtime_ns, size).
+
+    A same-size rewrite within one mtime tick (plan.md's [ ] -> [x], a
+    profile value edited in place) leaves both unchanged, so a cache keyed
+    on them would keep serving the old parse.
+    """
+    return time.time_ns() - st.st_mtime_ns <= RACY_MTIME_NS
+
+
+def move_dir(src: Path, dest: Path) -> None:
+    """Move a directory, using a plain rename when src and dest share a filesystem.
+
+    Raises:
+        OSError: with errno EEXIST or ENOTEMPTY if dest already exists and is
+            not empty (never nests src inside dest like shutil.move would)
+    """
+    try:
+        os.rename(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        if dest.exists():
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dest)) from e
+        shutil.move(str(src), str(dest))
+
+
+def replace_dir(src: Path, dest: Path) -> bool:
+    """Move src to dest, replacing any existing directory at dest.
+
+    Tries the move first rather than probing dest, so the common case is a
+    single rename. An existing dest is renamed aside to dest.old before src
+    moves in and deleted afterwards. If moving src in fails, the old dest is
+    renamed back before the error propagates; only if a partial copy already
+    occupies dest is it left at dest.old.
+
+    Returns:
+        True if an existing dest was replaced
+    """
+    try:
+        move_dir(src, dest)
+        return False
+    except OSError as e:
+        if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+            raise
+
+    stale = dest.with_name(dest.name + ".old")
+    shutil.rmtree(stale, ignore_errors=True)
+    os.rename(dest, stale)
+    try:
+        move_dir(src, dest)
+    except OSError:
+        if not dest.exists():
+            os.rename(stale, dest)
+        raise
+    shutil.rmtree(stale)
+    return True
@@ -4,12 +4,16 @@ Plan.md parser for AOS.
 Extracts micro-commits from plan files.
 """
 
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from .fsutil import is_racy_stat
+
 HEADING_RE = re.compile(r'^###\s+(COMMIT-[A-Za-z0-9_-]+-\d{3}):\s*(.+?)\s*$')
 DONE_RE = re.compile(r'^Done:\s*\[([ xX])\]\s*$')
+PLAN_CACHE_MAX_ENTRIES = 64  # Plans kept in _plan_cache; the oldest parse is evicted first
 
 
 @dataclass
@@ -21,13 +25,43 @@ class MicroCommit:
     block_content: str
 
 
+# Parsed plans keyed by path, with the (mtime_ns, size) they were parsed at
+_plan_cache: dict[str, tuple[tuple[int, int], list[MicroCommit]]] = {}
+
+
 def parse_plan(filepath: str) -> list[MicroCommit]:
-    """Parse plan.md and return list of micro-commits."""
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"Plan file not found: {filepath}")
+    """Parse plan.md and return list of micro-commits.
 
-    lines = path.read_text().splitlines()
+    Results are cached until the file changes on disk, so polling callers
+    (wf watch, the run loop) skip re-parsing an unchanged plan. Callers must
+    not mutate the returned commits.
+    """
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Plan file not found: {filepath}") from None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _plan_cache.get(filepath)
+    if cached and cached[0] == key:
+        return list(cached[1])
+
+    commits = _parse_plan_file(filepath)
+    if not is_racy_stat(st):
+        # Re-insert so dict order tracks parse time, then evict the oldest
+        _plan_cache.pop(filepath, None)
+        _plan_cache[filepath] = (key, commits)
+        if len(_plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+            del _plan_cache[next(iter(_plan_cache))]
+    return list(commits)
+
+
+def _parse_plan_file(filepath: str) -> list[MicroCommit]:
+    """Parse plan.md into micro-commits (uncached)."""
+    try:
+        lines = Path(filepath).read_text().splitlines()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Plan file not found: {filepath}") from None
     commits = []
     current = None
     current_lines = []
@@ -22,7 +22,7 @@ def annotate_reqs_for_story(
     project_config: ProjectConfig,
     timeout: int = 180,
     project_dir: Optional[Path] = None,
-) -> tuple[bool, str]:
+) -> tuple[bool, str, bool]:
     """
     Use Claude Code to annotate REQS.md with story WIP markers.
 
@@ -39,12 +39,13 @@ def annotate_reqs_for_story(
         timeout: Timeout in seconds
 
     Returns:
-        Tuple of (success, message)
+        Tuple of (success, message, changed) - changed is True if REQS.md
+        was modified by the annotation
     """
     reqs_path = project_config.repo_path / project_config.reqs_path
 
     if not reqs_path.exists():
-        return True, "No REQS.md to annotate"
+        return True, "No REQS.md to annotate", False
 
     # Build acceptance criteria as bullet list
     ac_list = "\n".join(f"- {ac}" for ac in story.acceptance_criteria)
@@ -79,6 +80,7 @@ Rules:
 After editing, respond with a brief summary of what you annotated.
 """
 
+    original = reqs_path.read_bytes()
     success, response = run_claude(
         prompt,
         cwd=project_config.repo_path,
@@ -89,9 +91,9 @@ After editing, respond with a brief summary of what you annotated.
 
     if not success:
         logger.warning(f"REQS annotation failed: {response}")
-        return False, f"Annotation failed: {response}"
+        return False, f"Annotation failed: {response}", False
 
-    return True, response
+    return True, response, reqs_path.read_bytes() != original
 
 
 def remove_reqs_annotations(
@@ -5,6 +5,7 @@ uncommitted changes, and other context that agents need.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -38,17 +39,23 @@ def _load_last_review_output(run_dir: Path, workstream_id: str) -> dict | None:
         Review dict or None if not found
     """
     runs_dir = run_dir.parent  # run_dir is {ops_dir}/runs/{run_id}
-    if not runs_dir.exists():
+    try:
+        with os.scandir(runs_dir) as entries:
+            ws_runs = [(e.stat().st_mtime, e.path) for e in entries if workstream_id in e.name]
+    except FileNotFoundError:
+        return None
+    if not ws_runs:
         return None
 
-    # Find most recent run for this workstream
-    ws_runs = sorted(
-        [d for d in runs_dir.iterdir() if workstream_id in d.name],
-        key=lambda d: d.stat().st_mtime,
-        reverse=True
-    )
-    for past_run_dir in ws_runs:
-        review = load_review(past_run_dir)
+    # The most recent run for this workstream nearly always has the review;
+    # only sort the rest when it doesn't
+    latest = max(ws_runs)
+    review = load_review(Path(latest[1]))
+    if review:
+        return review
+    ws_runs.remove(latest)
+    for _, past_run_path in sorted(ws_runs, reverse=True):
+        review = load_review(Path(past_run_path))
         if review:
             return review
     return None
@@ -17,6 +17,7 @@ Usage:
 """
 
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Callable
 
@@ -137,6 +138,14 @@ def _build_trigger_lookup() -> dict[tuple[str, str], str]:
 TRIGGER_FOR = _build_trigger_lookup()
 
 
+def _find_line(data: bytes, prefix: bytes) -> int:
+    """Return the offset of the first line starting with prefix, or -1."""
+    if data.startswith(prefix):
+        return 0
+    pos = data.find(b"\n" + prefix)
+    return pos + 1 if pos >= 0 else -1
+
+
 class WorkstreamFSM:
     """State machine for workstream status management.
 
@@ -192,23 +201,30 @@ class WorkstreamFSM:
         return "active"
 
     def _save_state(self) -> None:
-        """Save current state to meta.env."""
+        """Save current state to meta.env.
+
+        Entering "merged" also stamps MERGED_AT (if not already set) in the
+        same write, rather than callers re-reading the file to append it.
+        """
         meta_path = self.ws_dir / "meta.env"
         try:
-            content = meta_path.read_text()
-            lines = content.splitlines()
-
-            status_found = False
-            for i, line in enumerate(lines):
-                if line.startswith("STATUS="):
-                    lines[i] = f'STATUS="{self.state}"'
-                    status_found = True
-                    break
-
-            if not status_found:
-                lines.append(f'STATUS="{self.state}"')
-
-            meta_path.write_text("\n".join(lines) + "\n")
+            data = meta_path.read_bytes()
+            status_line = f'STATUS="{self.state}"'.encode()
+
+            # Splice the new value over the first STATUS= line in place
+            start = _find_line(data, b"STATUS=")
+            if start >= 0:
+                end = data.find(b"\n", start)
+                data = data[:start] + status_line + (data[end:] if end >= 0 else b"\n")
+            else:
+                if data and not data.endswith(b"\n"):
+                    data += b"\n"
+                data += status_line + b"\n"
+
+            if self.state == "merged" and _find_line(data, b"MERGED_AT=") < 0:
+                data += f'MERGED_AT="{datetime.now().isoformat()}"\n'.encode()
+
+            meta_path.write_bytes(data)
         except OSError as e:
             logger.warning(f"[FSM] {self.ws_id}: Error saving state: {e}")
 
@@ -1,11 +1,15 @@
 """Tests for orchestrator.lib.config module."""
 
+import os
+import time
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 
 from orchestrator.lib.config import (
     load_project_profile,
+    update_workstream_meta,
     VALID_MERGE_MODES,
 )
 
@@ -61,3 +65,48 @@ class TestValidMergeModes:
         assert "local" in VALID_MERGE_MODES
         assert "github_pr" in VALID_MERGE_MODES
         assert len(VALID_MERGE_MODES) == 2
+
+
+class TestProfileCache:
+    """Test load_project_profile caching keyed on file mtime/size."""
+
+    def test_reuses_profile_while_file_unchanged(self, tmp_path):
+        profile_env = tmp_path / "project_profile.env"
+        profile_env.write_text('TEST_CMD="pytest"\nMERGE_MODE="local"\n')
+        os.utime(profile_env, ns=(1_000_000_000, 1_000_000_000))
+        first = load_project_profile(tmp_path)
+        with patch("orchestrator.lib.config.envparse.load_env") as mock_load_env:
+            second = load_project_profile(tmp_path)
+        mock_load_env.assert_not_called()
+        assert second is first
+
+    def test_reloads_when_file_changes(self, tmp_path):
+        profile_env = tmp_path / "project_profile.env"
+        profile_env.write_text('TEST_CMD="pytest"\nMERGE_MODE="local"\n')
+        assert load_project_profile(tmp_path).test_cmd == "pytest"
+        profile_env.write_text('TEST_CMD="make check"\nMERGE_MODE="local"\n')
+        assert load_project_profile(tmp_path).test_cmd == "make check"
+
+    def test_same_size_edit_with_recent_mtime_is_seen(self, tmp_path):
+        profile_env = tmp_path / "project_profile.env"
+        now = time.time_ns()
+        profile_env.write_text('TEST_CMD="pytest"\nMERGE_MODE="local"\n')
+        os.utime(profile_env, ns=(now, now))
+        assert load_project_profile(tmp_path).test_cmd == "pytest"
+        # Same size, same mtime tick
+        profile_env.write_text('TEST_CMD="pytext"\nMERGE_MODE="local"\n')
+        os.utime(profile_env, ns=(now, now))
+        assert load_project_profile(tmp_path).test_cmd == "pytext"
+
+
+class TestUpdateWorkstreamMeta:
+    """Test update_workstream_meta field updates."""
+
+    def test_updates_removes_and_appends_fields(self, tmp_path):
+        (tmp_path / "meta.env").write_text(
+            'ID="ws"\nWORKTREE="/old"\nWORKTREE_X="keep"\nCLOSED_AT="2024-01-01"\n'
+        )
+        update_workstream_meta(tmp_path, {"WORKTREE": "/new", "CLOSED_AT": None, "PR_NUMBER": "7"})
+        assert (tmp_path / "meta.env").read_text() == (
+            'ID="ws"\nWORKTREE="/new"\nWORKTREE_X="keep"\nPR_NUMBER="7"\n'
+        )
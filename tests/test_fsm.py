@@ -189,6 +189,25 @@ class TestFSMMergeConflicts:
         fsm.resolve_conflicts()
         assert fsm.state == "active"
 
+    def test_merge_success_stamps_merged_at(self, ws_dir_at_merging):
+        """Entering merged writes MERGED_AT alongside STATUS."""
+        fsm = WorkstreamFSM(ws_dir_at_merging)
+        fsm.merge_success()
+
+        content = (ws_dir_at_merging / "meta.env").read_text()
+        assert 'STATUS="merged"' in content
+        assert content.count("MERGED_AT=") == 1
+
+    def test_merged_at_not_overwritten(self, ws_dir_at_merging):
+        """An existing MERGED_AT is kept."""
+        meta = ws_dir_at_merging / "meta.env"
+        meta.write_text('STATUS="merging"\nMERGED_AT="2024-01-01T00:00:00"\n')
+        WorkstreamFSM(ws_dir_at_merging).merge_success()
+
+        content = meta.read_text()
+        assert content.count("MERGED_AT=") == 1
+        assert 'MERGED_AT="2024-01-01T00:00:00"' in content
+
 
 class TestTriggerLookup:
     """Tests for TRIGGER_FOR lookup table."""
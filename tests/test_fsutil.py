@@ -0,0 +1,92 @@
+"""Tests for orchestrator.lib.fsutil module."""
+
+import errno
+import os
+
+import pytest
+from unittest.mock import patch
+
+from orchestrator.lib.fsutil import is_racy_stat, move_dir, replace_dir
+
+
+class TestMoveDir:
+    """Test move_dir rename fast path."""
+
+    def test_moves_directory(self, tmp_path):
+        src = tmp_path / "ws"
+        src.mkdir()
+        (src / "meta.env").write_text("ID=ws\n")
+        dest = tmp_path / "_closed" / "ws"
+        dest.parent.mkdir()
+
+        move_dir(src, dest)
+
+        assert not src.exists()
+        assert (dest / "meta.env").read_text() == "ID=ws\n"
+
+    def test_raises_when_dest_not_empty(self, tmp_path):
+        src = tmp_path / "ws"
+        src.mkdir()
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "old.txt").write_text("old")
+
+        with pytest.raises(OSError) as exc_info:
+            move_dir(src, dest)
+        assert exc_info.value.errno in (errno.EEXIST, errno.ENOTEMPTY)
+
+
+class TestReplaceDir:
+    """Test replace_dir overwrite handling."""
+
+    def test_returns_false_when_dest_missing(self, tmp_path):
+        src = tmp_path / "ws"
+        src.mkdir()
+        assert replace_dir(src, tmp_path / "dest") is False
+        assert (tmp_path / "dest").is_dir()
+
+    def test_replaces_existing_dest(self, tmp_path):
+        src = tmp_path / "ws"
+        src.mkdir()
+        (src / "new.txt").write_text("new")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "old.txt").write_text("old")
+
+        assert replace_dir(src, dest) is True
+
+        assert (dest / "new.txt").exists()
+        assert not (dest / "old.txt").exists()
+        assert not (tmp_path / "dest.old").exists()
+
+    def test_restores_dest_when_move_fails(self, tmp_path):
+        src = tmp_path / "ws"
+        src.mkdir()
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "old.txt").write_text("old")
+        failures = [OSError(errno.ENOTEMPTY, "not empty"), OSError(errno.EIO, "I/O error")]
+
+        with patch("orchestrator.lib.fsutil.move_dir", side_effect=failures):
+            with pytest.raises(OSError) as exc_info:
+                replace_dir(src, dest)
+
+        assert exc_info.value.errno == errno.EIO
+        assert (dest / "old.txt").read_text() == "old"
+        assert not (tmp_path / "dest.old").exists()
+        assert src.is_dir()
+
+
+class TestIsRacyStat:
+    """Test is_racy_stat mtime window."""
+
+    def test_fresh_file_is_racy(self, tmp_path):
+        path = tmp_path / "plan.md"
+        path.write_text("x")
+        assert is_racy_stat(path.stat()) is True
+
+    def test_old_file_is_not_racy(self, tmp_path):
+        path = tmp_path / "plan.md"
+        path.write_text("x")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        assert is_racy_stat(path.stat()) is False
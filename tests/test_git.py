@@ -9,6 +9,9 @@ from orchestrator.git.status import (
     has_uncommitted_changes,
     get_changed_files,
 )
+from orchestrator.git.diff import get_conflicted_files
+from orchestrator.git.branch import resolve_revs
+from orchestrator.git.commit import commit_file
 
 
 class TestGitResult:
@@ -116,3 +119,73 @@ class TestGetChangedFiles:
         )
         files = get_changed_files(Path("/tmp"))
         assert files == ["path with spaces/file.txt"]
+
+
+class TestGetConflictedFiles:
+    """Test get_conflicted_files parsing of ls-files --unmerged."""
+
+    @patch("orchestrator.git.diff.run_git")
+    def test_empty_when_no_conflicts(self, mock_run):
+        mock_run.return_value = GitResult(returncode=0, stdout="", stderr="")
+        assert get_conflicted_files(Path("/tmp")) == []
+
+    @patch("orchestrator.git.diff.run_git")
+    def test_deduplicates_stages(self, mock_run):
+        mock_run.return_value = GitResult(
+            returncode=0,
+            stdout=(
+                "100644 aaa 1\ta.txt\0"
+                "100644 bbb 2\ta.txt\0"
+                "100644 ccc 3\ta.txt\0"
+                "100644 ddd 2\tdir/b.txt\0"
+                "100644 eee 3\tdir/b.txt\0"
+            ),
+            stderr="",
+        )
+        assert get_conflicted_files(Path("/tmp")) == ["a.txt", "dir/b.txt"]
+
+    @patch("orchestrator.git.diff.run_git")
+    def test_handles_newline_in_filename(self, mock_run):
+        mock_run.return_value = GitResult(
+            returncode=0, stdout="100644 aaa 2\tline\nbreak.txt\0", stderr=""
+        )
+        assert get_conflicted_files(Path("/tmp")) == ["line\nbreak.txt"]
+
+
+class TestResolveRevs:
+    """Test resolve_revs batch-check parsing."""
+
+    @patch("orchestrator.git.branch.run_git")
+    def test_maps_missing_revs_to_none(self, mock_run):
+        mock_run.return_value = GitResult(
+            returncode=0, stdout="refs/heads/feat missing\nabc123\n", stderr=""
+        )
+        shas = resolve_revs(Path("/tmp"), ["refs/heads/feat", "main^{commit}"])
+        assert shas == {"refs/heads/feat": None, "main^{commit}": "abc123"}
+        assert mock_run.call_args.kwargs["input"] == "refs/heads/feat\nmain^{commit}\n"
+
+    @patch("orchestrator.git.branch.run_git")
+    def test_all_none_when_git_fails(self, mock_run):
+        mock_run.return_value = GitResult(returncode=128, stdout="", stderr="not a git repo")
+        assert resolve_revs(Path("/tmp"), ["main"]) == {"main": None}
+
+
+class TestCommitFile:
+    """Test commit_file single-process commit with untracked fallback."""
+
+    @patch("orchestrator.git.commit.run_git")
+    def test_tracked_file_commits_in_one_call(self, mock_run):
+        mock_run.return_value = GitResult(returncode=0, stdout="", stderr="")
+        assert commit_file(Path("/tmp"), "REQS.md", "msg").success
+        mock_run.assert_called_once_with(["commit", "-m", "msg", "--", "REQS.md"], Path("/tmp"))
+
+    @patch("orchestrator.git.commit.run_git")
+    def test_untracked_file_falls_back_to_add(self, mock_run):
+        mock_run.side_effect = [
+            GitResult(returncode=1, stdout="",
+                      stderr="error: pathspec 'new.md' did not match any file(s) known to git"),
+            GitResult(returncode=0, stdout="", stderr=""),
+            GitResult(returncode=0, stdout="", stderr=""),
+        ]
+        assert commit_file(Path("/tmp"), "new.md", "msg").success
+        assert mock_run.call_args_list[1].args[0] == ["add", "--", "new.md"]
@@ -0,0 +1,142 @@
+"""Tests for merge conflict helpers in orchestrator.commands.merge."""
+
+from unittest.mock import MagicMock, patch
+
+from orchestrator.commands.merge import (
+    _count_conflict_markers,
+    _extract_conflict_hunks,
+    _has_conflict_markers,
+    _resolve_conflicts_with_codex,
+)
+
+
+HUNK = "<<<<<<< HEAD\nours\n=======\ntheirs\n>>>>>>> feat/x\n"
+
+
+def _lines(prefix: str, count: int) -> str:
+    return "".join(f"{prefix}{i}\n" for i in range(count))
+
+
+class TestHasConflictMarkers:
+    """Test _has_conflict_markers chunked scan."""
+
+    def test_finds_marker(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("top\n" + HUNK)
+
+        assert _has_conflict_markers(path) is True
+
+    def test_clean_file(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text(_lines("line", 50))
+
+        assert _has_conflict_markers(path) is False
+
+    def test_ignores_marker_text_mid_line(self, tmp_path):
+        path = tmp_path / "merge.py"
+        path.write_text('CONFLICT_MARKER = b"<<<<<<<"\n')
+
+        assert _has_conflict_markers(path) is False
+
+    def test_marker_straddling_chunk_boundary(self, tmp_path):
+        # With 8-byte chunks the marker starts 3 bytes before the first boundary
+        path = tmp_path / "a.py"
+        path.write_text("abcd\n" + HUNK)
+
+        with patch("orchestrator.commands.merge.CONFLICT_SCAN_CHUNK_BYTES", 8):
+            assert _has_conflict_markers(path) is True
+
+    def test_missing_file(self, tmp_path):
+        assert _has_conflict_markers(tmp_path / "gone.py") is False
+
+
+class TestCountConflictMarkers:
+    """Test _count_conflict_markers chunked counting."""
+
+    def test_counts_markers_across_files(self, tmp_path):
+        (tmp_path / "a.py").write_text(HUNK + "middle\n" + HUNK)
+        (tmp_path / "b.py").write_text("top\n" + HUNK)
+
+        assert _count_conflict_markers(tmp_path, ["a.py", "b.py"]) == 3
+
+    def test_ignores_marker_text_mid_line(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = '<<<<<<<'\n")
+
+        assert _count_conflict_markers(tmp_path, ["a.py"]) == 0
+
+    def test_marker_straddling_chunks_counted_once(self, tmp_path):
+        # Chunk boundaries at 4, 8, 12...: the marker spans two of them
+        (tmp_path / "a.py").write_text("abcdef\n" + HUNK)
+
+        with patch("orchestrator.commands.merge.CONFLICT_SCAN_CHUNK_BYTES", 4):
+            assert _count_conflict_markers(tmp_path, ["a.py"]) == 1
+
+    def test_missing_file_counts_zero(self, tmp_path):
+        assert _count_conflict_markers(tmp_path, ["gone.py"]) == 0
+
+
+class TestResolveConflictsWithCodex:
+    """Test _resolve_conflicts_with_codex leftover-conflict check."""
+
+    @patch("orchestrator.commands.merge.get_conflicted_files", return_value=[])
+    @patch("orchestrator.commands.merge.CodexAgent")
+    def test_marker_text_mid_line_counts_as_resolved(self, mock_agent_cls, _mock_conflicted, tmp_path):
+        path = tmp_path / "merge.py"
+        path.write_text(HUNK)
+
+        def resolve(prompt, repo_path):
+            path.write_text('CONFLICT_MARKER = b"<<<<<<<"\n')
+            return MagicMock(success=True)
+
+        mock_agent_cls.return_value.implement.side_effect = resolve
+        ws = MagicMock(title="ws")
+        profile = MagicMock(implement_timeout=60)
+
+        assert _resolve_conflicts_with_codex(tmp_path, ["merge.py"], ws, profile) == []
+
+
+@patch("orchestrator.commands.merge.CONFLICT_CONTEXT_LINES", 2)
+class TestExtractConflictHunks:
+    """Test _extract_conflict_hunks context windows and truncation."""
+
+    def test_context_and_elision_around_one_hunk(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text(_lines("before", 5) + HUNK + _lines("after", 5))
+
+        assert _extract_conflict_hunks(path) == (
+            "...\nbefore3\nbefore4\n" + HUNK + "after0\nafter1\n...\n"
+        )
+
+    def test_close_hunks_share_context_without_elision(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("top\n" + HUNK + _lines("mid", 3) + HUNK + "end\n")
+
+        assert _extract_conflict_hunks(path) == (
+            "top\n" + HUNK + _lines("mid", 3) + HUNK + "end\n"
+        )
+
+    def test_distant_hunks_elide_the_gap(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text(HUNK + _lines("mid", 6) + HUNK)
+
+        assert _extract_conflict_hunks(path) == (
+            HUNK + "mid0\nmid1\n...\nmid4\nmid5\n" + HUNK
+        )
+
+    def test_truncates_at_prompt_cap(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text(HUNK * 10)
+
+        with patch("orchestrator.commands.merge.CONFLICT_PROMPT_CHARS", 20):
+            result = _extract_conflict_hunks(path)
+
+        assert result == "<<<<<<< HEAD\nours\n=======\n... (truncated)\n"
+
+    def test_no_markers_returns_none(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text(_lines("line", 50))
+
+        assert _extract_conflict_hunks(path) is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert _extract_conflict_hunks(tmp_path / "gone.py") is None
@@ -0,0 +1,28 @@
+"""Tests for orchestrator.commands.open module."""
+
+from orchestrator.commands.open import _parse_numstat
+
+
+class TestParseNumstat:
+    """Test _parse_numstat -z parsing."""
+
+    def test_plain_entries(self):
+        output = "2\t0\ta.txt\x003\t5\tdir/b.py\x00"
+        assert _parse_numstat(output) == {"a.txt": (2, 0), "dir/b.py": (3, 5)}
+
+    def test_binary_counts_as_zero(self):
+        assert _parse_numstat("-\t-\tb.bin\x00") == {"b.bin": (0, 0)}
+
+    def test_rename_keyed_by_new_path(self):
+        output = "2\t0\ta.txt\x001\t0\t\x00old.txt\x00new.txt\x00-\t-\tb.bin\x00"
+        assert _parse_numstat(output) == {
+            "a.txt": (2, 0),
+            "new.txt": (1, 0),
+            "b.bin": (0, 0),
+        }
+
+    def test_path_with_tab_and_newline(self):
+        assert _parse_numstat("1\t1\tweird\tname\nx\x00") == {"weird\tname\nx": (1, 1)}
+
+    def test_empty_output(self):
+        assert _parse_numstat("") == {}
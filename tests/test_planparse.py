@@ -1,8 +1,12 @@
 """Tests for orchestrator.lib.planparse module."""
 
+import os
+import time
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
+from orchestrator.lib import planparse
 from orchestrator.lib.planparse import (
     parse_plan,
     get_next_microcommit,
@@ -198,6 +202,48 @@ Done: [x]
             parse_plan(str(tmp_path / "nonexistent.md"))
 
 
+class TestParsePlanCache:
+    """Test parse_plan caching keyed on file mtime/size."""
+
+    PLAN = "### COMMIT-FOO-001: First\n\nDone: [ ]\n"
+
+    def _write_old(self, plan_file, content):
+        plan_file.write_text(content)
+        os.utime(plan_file, ns=(1_000_000_000, 1_000_000_000))
+
+    def test_reuses_parse_while_file_unchanged(self, tmp_path):
+        plan_file = tmp_path / "plan.md"
+        self._write_old(plan_file, self.PLAN)
+        parse_plan(str(plan_file))
+        with patch("orchestrator.lib.planparse._parse_plan_file") as mock_parse:
+            commits = parse_plan(str(plan_file))
+        mock_parse.assert_not_called()
+        assert commits[0].id == "COMMIT-FOO-001"
+
+    def test_same_size_edit_with_recent_mtime_is_seen(self, tmp_path):
+        plan_file = tmp_path / "plan.md"
+        now = time.time_ns()
+        plan_file.write_text(self.PLAN)
+        os.utime(plan_file, ns=(now, now))
+        assert parse_plan(str(plan_file))[0].done is False
+        # mark_done-style rewrite: same size, same mtime tick
+        plan_file.write_text(self.PLAN.replace("[ ]", "[x]"))
+        os.utime(plan_file, ns=(now, now))
+        assert parse_plan(str(plan_file))[0].done is True
+
+    @patch("orchestrator.lib.planparse.PLAN_CACHE_MAX_ENTRIES", 2)
+    @patch.dict("orchestrator.lib.planparse._plan_cache", clear=True)
+    def test_evicts_oldest_plan_beyond_limit(self, tmp_path):
+        paths = []
+        for name in ("a", "b", "c"):
+            plan_file = tmp_path / f"{name}.md"
+            self._write_old(plan_file, self.PLAN)
+            parse_plan(str(plan_file))
+            paths.append(str(plan_file))
+
+        assert list(planparse._plan_cache) == paths[1:]
+
+
 class TestGetNextMicrocommit:
     """Test get_next_microcommit function."""
 